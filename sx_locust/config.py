@@ -13,7 +13,9 @@ class ServiceXConfig:
     """Configuration for ServiceX operations."""
     endpoint: str
     timeout: int = 60
-    max_retries: int = 3
+    max_retries: int = 0
+    retry_backoff: float = 1.0
+    retry_backoff_max: float = 30.0
     auth_token: Optional[str] = None
     auth_type: str = "token"
 
@@ -34,12 +36,20 @@ class TestDataConfig:
     cms_files: List[str] = field(default_factory=list)
 
 
+@dataclass
+class ReplayConfig:
+    """Configuration for replaying recorded ServiceX request traces."""
+    trace_path: Optional[str] = None
+    speedup: float = 1.0
+
+
 @dataclass
 class Config:
     """Main configuration class."""
     servicex: ServiceXConfig
     load_test: LoadTestConfig
     test_data: TestDataConfig
+    replay: ReplayConfig = field(default_factory=ReplayConfig)
     log_level: str = "INFO"
     cache_path: str = "/tmp/servicex_cache"
 
@@ -49,7 +59,9 @@ class Config:
         servicex_config = ServiceXConfig(
             endpoint=os.getenv("SERVICEX_ENDPOINT", "https://servicex.example.com"),
             timeout=int(os.getenv("SERVICEX_TIMEOUT", "60")),
-            max_retries=int(os.getenv("SERVICEX_MAX_RETRIES", "3")),
+            max_retries=int(os.getenv("SERVICEX_MAX_RETRIES", "0")),
+            retry_backoff=float(os.getenv("SERVICEX_RETRY_BACKOFF", "1.0")),
+            retry_backoff_max=float(os.getenv("SERVICEX_RETRY_BACKOFF_MAX", "30.0")),
             auth_token=os.getenv("SERVICEX_TOKEN"),
             auth_type=os.getenv("SERVICEX_AUTH_TYPE", "token"),
         )
@@ -75,10 +87,16 @@ class Config:
             cms_files=cms_files,
         )
         
+        replay_config = ReplayConfig(
+            trace_path=os.getenv("REPLAY_TRACE_PATH"),
+            speedup=float(os.getenv("REPLAY_SPEEDUP", "1.0")),
+        )
+        
         return cls(
             servicex=servicex_config,
             load_test=load_test_config,
             test_data=test_data_config,
+            replay=replay_config,
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             cache_path=os.getenv("SERVICEX_CACHE_PATH", "/tmp/servicex_cache"),
         )
@@ -100,11 +118,14 @@ class Config:
         servicex_data = config_data.get("servicex", {})
         load_test_data = config_data.get("load_testing", {})
         test_data_data = config_data.get("test_data", {})
+        replay_data = config_data.get("replay", {})
         
         servicex_config = ServiceXConfig(
             endpoint=servicex_data.get("endpoint", "https://servicex.example.com"),
             timeout=servicex_data.get("timeout", 60),
-            max_retries=servicex_data.get("max_retries", 3),
+            max_retries=servicex_data.get("max_retries", 0),
+            retry_backoff=servicex_data.get("retry_backoff", 1.0),
+            retry_backoff_max=servicex_data.get("retry_backoff_max", 30.0),
             auth_token=servicex_data.get("auth_token"),
             auth_type=servicex_data.get("auth_type", "token"),
         )
@@ -121,10 +142,16 @@ class Config:
             cms_files=test_data_data.get("cms_files", []),
         )
         
+        replay_config = ReplayConfig(
+            trace_path=replay_data.get("trace_path"),
+            speedup=replay_data.get("speedup", 1.0),
+        )
+        
         return cls(
             servicex=servicex_config,
             load_test=load_test_config,
             test_data=test_data_config,
+            replay=replay_config,
             log_level=config_data.get("log_level", "INFO"),
             cache_path=config_data.get("cache_path", "/tmp/servicex_cache"),
         )
@@ -166,6 +193,12 @@ class Config:
         if self.servicex.max_retries < 0:
             errors.append("ServiceX max_retries must be non-negative")
         
+        if self.servicex.retry_backoff < 0:
+            errors.append("ServiceX retry_backoff must be non-negative")
+        
+        if self.servicex.retry_backoff_max < self.servicex.retry_backoff:
+            errors.append("ServiceX retry_backoff_max must not be less than retry_backoff")
+        
         # Validate load test configuration
         if self.load_test.concurrent_users <= 0:
             errors.append("Concurrent users must be positive")
@@ -173,6 +206,10 @@ class Config:
         if self.load_test.spawn_rate <= 0:
             errors.append("Spawn rate must be positive")
         
+        # Validate replay configuration
+        if self.replay.speedup <= 0:
+            errors.append("Replay speedup must be positive")
+        
         # Validate log level
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         if self.log_level.upper() not in valid_log_levels:
@@ -0,0 +1,144 @@
+"""
+Error taxonomy for ServiceX Locust tests.
+
+Errors are classified inside the execution process and carried back across the
+multiprocessing queue as a plain category string, then rebuilt into one of the
+exception classes below so Locust groups failures by kind rather than by message.
+"""
+import asyncio
+import re
+from typing import Any, Dict, Optional, Type
+
+
+class ServiceXTestError(Exception):
+    """Base class for all ServiceX test failures."""
+    category = "unknown"
+    retryable = False
+
+    def __init__(self, method_name: str, message: str,
+                 exception_class: Optional[str] = None):
+        super().__init__(f"ServiceX test {method_name} failed: {message}")
+        self.method_name = method_name
+        self.message = message
+        self.exception_class = exception_class
+
+    def __repr__(self) -> str:
+        # Locust keys failures on repr(), so keep the free-text message out of it
+        return f"{type(self).__name__}({self.category!r})"
+
+
+class ServiceXTimeoutError(ServiceXTestError):
+    """The test did not complete in time, locally or on the ServiceX side."""
+    category = "timeout"
+    retryable = True
+
+
+class ServiceXAppError(ServiceXTestError):
+    """The ServiceX app answered with an HTTP 5xx error."""
+    category = "servicex_app"
+    retryable = True
+
+
+class ServiceXClientError(ServiceXTestError):
+    """The ServiceX app rejected the request with an HTTP 4xx error."""
+    category = "servicex_client"
+
+
+class TransformFailedError(ServiceXTestError):
+    """The transformers reported failed files for the request."""
+    category = "transform"
+
+
+class WorkerImportError(ServiceXTestError):
+    """The execution process could not import the test or its dependencies."""
+    category = "import"
+
+
+ERROR_CLASSES: Dict[str, Type[ServiceXTestError]] = {
+    cls.category: cls
+    for cls in (
+        ServiceXTestError,
+        ServiceXTimeoutError,
+        ServiceXAppError,
+        ServiceXClientError,
+        TransformFailedError,
+        WorkerImportError,
+    )
+}
+
+_WEBAPI_STATUS_PATTERN = re.compile(r"WebAPI Error.*?\b([45]\d\d)\b", re.IGNORECASE | re.DOTALL)
+# Raised by servicex when transformers report failed files for a request
+_TRANSFORM_FAILURE_PATTERN = re.compile(r"completed with failures: \d+/\d+ files failed")
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from an exception raised by the HTTP client, if any."""
+    response: Any = getattr(exc, "response", None)
+    for source in (response, exc):
+        for attr in ("status_code", "status"):
+            value = getattr(source, attr, None)
+            if isinstance(value, int):
+                return value
+
+    match = _WEBAPI_STATUS_PATTERN.search(str(exc))
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def _classify_single(exc: BaseException) -> Optional[str]:
+    """Classify one exception, ignoring its cause chain."""
+    if isinstance(exc, ImportError):
+        return "import"
+
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)) or "Timeout" in type(exc).__name__:
+        return "timeout"
+
+    # servicex raises AuthorizationError on 401 without the status in the message
+    if type(exc).__name__ == "AuthorizationError":
+        return "servicex_client"
+
+    status = _status_code(exc)
+    if status is not None:
+        if status >= 500:
+            return "servicex_app"
+        if status >= 400:
+            return "servicex_client"
+
+    if _TRANSFORM_FAILURE_PATTERN.search(str(exc)):
+        return "transform"
+
+    return None
+
+
+def classify_exception(exc: BaseException) -> str:
+    """Return the error category for an exception raised while running a test."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        category = _classify_single(current)
+        if category is not None:
+            return category
+        current = current.__cause__ or current.__context__
+    return ServiceXTestError.category
+
+
+def error_from_info(method_name: str, error_info: Dict[str, Any]) -> ServiceXTestError:
+    """Rebuild a typed exception from the error dict sent by the execution process."""
+    error_class = ERROR_CLASSES.get(error_info.get('error_type', ''), ServiceXTestError)
+    return error_class(
+        method_name,
+        error_info.get('error', ''),
+        exception_class=error_info.get('exception_class'),
+    )
+
+
+def should_retry(exc: BaseException, attempt: int, max_retries: int) -> bool:
+    """Return True if a failed attempt (counting from 0) should be retried."""
+    return isinstance(exc, ServiceXTestError) and exc.retryable and attempt < max_retries
+
+
+def retry_delay(attempt: int, backoff: float, backoff_max: float) -> float:
+    """Return the exponential backoff delay before retrying a failed attempt."""
+    return min(backoff * (2 ** attempt), backoff_max)
@@ -0,0 +1,154 @@
+"""
+Record-and-replay of ServiceX request traces.
+
+A trace is a JSON Lines file with one request per line, ordered by timestamp:
+
+    {"timestamp": 1718000000.5, "task": "uproot_raw_query", "files": ["root://..."]}
+
+``timestamp`` is epoch seconds or an ISO-8601 string, ``task`` names a test in
+``ServiceXTasks`` and the optional ``files`` list replaces the dataset of the
+test's samples. Traces may be gzip-compressed (``.gz``).
+
+Each Locust worker streams the file and only parses the lines of its own shard,
+so large traces are never loaded in full, neither on the workers nor on the master.
+"""
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import IO, Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TraceRecord:
+    """A single recorded ServiceX request."""
+    line_number: int
+    timestamp: float
+    task: str
+    files: Optional[List[str]] = None
+
+
+def _open_trace(path: str) -> IO[str]:
+    """Open a trace file for streaming, transparently decompressing gzip files."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path, "r")
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Convert an epoch or ISO-8601 timestamp to epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        # fromisoformat() only accepts a trailing 'Z' from Python 3.11 on
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    raise ValueError(f"Unsupported timestamp: {value!r}")
+
+
+def parse_trace_line(line: str, line_number: int) -> TraceRecord:
+    """Parse one line of a trace file."""
+    try:
+        data = json.loads(line)
+        return TraceRecord(
+            line_number=line_number,
+            timestamp=_parse_timestamp(data["timestamp"]),
+            task=data["task"],
+            files=data.get("files"),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid trace record on line {line_number + 1}: {e}") from e
+
+
+def read_trace(path: str, shard_index: int = 0, shard_count: int = 1) -> Iterator[TraceRecord]:
+    """Stream the records of one shard of a trace file.
+
+    Lines are assigned round-robin, so every shard sees the whole time span of the trace.
+    Malformed lines are logged and skipped rather than ending the shard.
+    """
+    with _open_trace(path) as f:
+        for line_number, line in enumerate(f):
+            if line_number % shard_count != shard_index or not line.strip():
+                continue
+            try:
+                record = parse_trace_line(line, line_number)
+            except ValueError as e:
+                logger.warning(f"Skipping trace line: {e}")
+                continue
+            yield record
+
+
+def read_trace_start(path: str) -> float:
+    """Return the timestamp of the first record, which is time zero of the replay."""
+    with _open_trace(path) as f:
+        for line_number, line in enumerate(f):
+            if line.strip():
+                return parse_trace_line(line, line_number).timestamp
+    raise ValueError(f"Trace file is empty: {path}")
+
+
+class TraceReplay:
+    """Hands out the records of one trace shard and paces them to their recorded times.
+
+    started_at is the wall-clock time of the first record; it is shared by all
+    workers so that the shards keep their recorded inter-arrival times.
+    """
+
+    def __init__(self, path: str, started_at: float, speedup: float = 1.0,
+                 shard_index: int = 0, shard_count: int = 1):
+        self.path = path
+        self.started_at = started_at
+        self.speedup = speedup
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.trace_start = read_trace_start(path)
+        self._records = read_trace(path, shard_index, shard_count)
+
+    def next_record(self) -> Optional[TraceRecord]:
+        """Return the next record of this shard, or None once the trace is exhausted."""
+        # Reading the file never yields to gevent, so users sharing this replay
+        # can't interleave inside the generator
+        return next(self._records, None)
+
+    def due_time(self, record: TraceRecord) -> float:
+        """Return the wall-clock time at which a record should be issued."""
+        return self.started_at + (record.timestamp - self.trace_start) / self.speedup
+
+    def wait_for(self, record: TraceRecord) -> float:
+        """Sleep until a record is due and return how late it is, in seconds."""
+        delay = self.due_time(record) - time.time()
+        if delay > 0:
+            time.sleep(delay)
+            return 0.0
+        return -delay
+
+
+# Replay shared by all users of this worker process, replaced on every test start
+_replay: Optional[TraceReplay] = None
+
+
+def start_trace_replay(path: str, started_at: float, speedup: float = 1.0,
+                       shard_index: int = 0, shard_count: int = 1) -> TraceReplay:
+    """Start a fresh replay for this worker process, discarding any previous one."""
+    global _replay
+    # Clear first, so a trace that fails to open doesn't leave the previous replay running
+    _replay = None
+    _replay = TraceReplay(path, started_at, speedup, shard_index, shard_count)
+    return _replay
+
+
+def stop_trace_replay() -> None:
+    """Discard the replay of this worker process."""
+    global _replay
+    _replay = None
+
+
+def get_trace_replay() -> Optional[TraceReplay]:
+    """Get the running replay of this worker process, if any."""
+    return _replay
@@ -0,0 +1,138 @@
+from locust import User, constant, events, task
+from locust.exception import StopUser
+from locust.runners import STATE_MISSING, MasterRunner, WorkerRunner
+from sx_locust.config import get_config
+import logging
+import time
+
+from sx_locust.replay import get_trace_replay, start_trace_replay, stop_trace_replay
+from sx_locust.tasks import ServiceXTasks
+from sx_locust.util import make_locust_task
+
+logger = logging.getLogger(__name__)
+
+
+def _start_replay(started_at, shard_index, shard_count):
+    """Start this process's replay of its shard of the configured trace."""
+    replay_config = get_config().replay
+    if not replay_config.trace_path:
+        logger.error("Replay trace path is not configured (REPLAY_TRACE_PATH)")
+        return
+
+    # This runs inside the worker's message loop, which must not die on a bad trace
+    try:
+        start_trace_replay(
+            replay_config.trace_path,
+            started_at,
+            replay_config.speedup,
+            shard_index,
+            shard_count,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not start replay of {replay_config.trace_path}: {e}")
+        return
+    logger.info(f"Replaying {replay_config.trace_path} (shard {shard_index + 1}/{shard_count}, "
+                f"speedup {replay_config.speedup}x)")
+
+
+def on_replay_start(environment, msg, **kwargs):
+    """Start the replay with the shard and time zero assigned by the master."""
+    _start_replay(msg.data["started_at"], msg.data["shard_index"], msg.data["shard_count"])
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message("replay_start", on_replay_start)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    runner = environment.runner
+    started_at = time.time()
+    if isinstance(runner, MasterRunner):
+        # Assign shards from the workers connected right now, rather than from the
+        # ever-growing worker indexes, and share one time zero across all of them.
+        # This is sent before the spawn messages, so workers have it before any user starts.
+        client_ids = sorted(node.id for node in runner.clients.values() if node.state != STATE_MISSING)
+        user_count = getattr(runner, "target_user_count", None)
+        if user_count is not None and user_count < len(client_ids):
+            # The dispatcher gives some workers no users, and their shards are then never replayed
+            logger.warning(f"Replaying with {user_count} users on {len(client_ids)} workers: "
+                           f"at least one user per worker is needed to replay the whole trace")
+        for shard_index, client_id in enumerate(client_ids):
+            runner.send_message(
+                "replay_start",
+                {"started_at": started_at, "shard_index": shard_index, "shard_count": len(client_ids)},
+                client_id=client_id,
+            )
+    elif not isinstance(runner, WorkerRunner):
+        _start_replay(started_at, 0, 1)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    if not isinstance(environment.runner, MasterRunner):
+        stop_trace_replay()
+
+
+class ServiceXReplayUser(User):
+    """Replays a recorded ServiceX request trace instead of issuing synthetic load.
+
+    Every user on a worker shares that worker's shard of the trace, so the number
+    of users bounds how many recorded requests can be in flight at once.
+    """
+    wait_time = constant(0)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config = get_config()
+        self.servicex_config = self.config.servicex
+        self._tasks = {}
+        self._setup_logging()
+
+    def _setup_logging(self) -> None:
+        """Set up logging configuration."""
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(getattr(logging, self.config.log_level.upper()))
+
+    def _get_task(self, method_name):
+        """Get the Locust task for a ServiceX test, or None if no such test exists."""
+        if method_name not in self._tasks:
+            test_method = getattr(ServiceXTasks, method_name, None)
+            if not getattr(test_method, "__is_servicex_locust_test__", False):
+                return None
+            self._tasks[method_name] = make_locust_task(method_name)
+        return self._tasks[method_name]
+
+    def on_start(self):
+        """Called when a user starts"""
+        self.logger.info("ServiceX replay user starting")
+
+    @task
+    def replay_trace(self):
+        replay = get_trace_replay()
+        if replay is None:
+            # e.g. a worker that joined after the test started and got no shard
+            self.logger.error("No trace replay is running on this worker, stopping replay user")
+            raise StopUser()
+
+        record = replay.next_record()
+        if record is None:
+            self.logger.info("Trace exhausted, stopping replay user")
+            raise StopUser()
+
+        locust_task = self._get_task(record.task)
+        if locust_task is None:
+            self.logger.warning(f"Skipping trace line {record.line_number + 1}: unknown test {record.task}")
+            return
+
+        lag = replay.wait_for(record)
+        if lag > 1:
+            self.logger.warning(f"Trace line {record.line_number + 1} issued {lag:.1f}s behind schedule")
+
+        locust_task(self, files=record.files)
+
+    def on_stop(self):
+        """Called when a user stops"""
+        self.logger.info("ServiceX replay user stopping")
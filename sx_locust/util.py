@@ -16,14 +16,32 @@ Multiprocessing worker module for ServiceX tests.
 This module is separated to avoid import issues with multiprocessing 'spawn' method.
 """
 import sys
+import time
 from queue import Empty
 
 from locust import task
 
+from sx_locust.errors import (
+    ServiceXTestError, ServiceXTimeoutError, error_from_info, retry_delay, should_retry
+)
+
+
+def _fire_request_event(user, request_type, method_name, start_time, exception=None, attempt=0):
+    """Report one attempt to Locust so it is counted and timed in the request statistics."""
+    user.environment.events.request.fire(
+        request_type=request_type,
+        name=method_name,
+        response_time=(time.perf_counter() - start_time) * 1000,
+        response_length=0,
+        exception=exception,
+        context={"attempt": attempt},
+    )
+
 
 # Create a Locust task wrapper
 def make_locust_task(method_name):
-    def locust_task(self):
+    def run_servicex_test(self, files=None):
+        """Run a single attempt of a ServiceX test in a separate process."""
         # Execute the ServiceX test via multiprocessing
         print(f"🚀 Starting ServiceX test: {method_name}", file=sys.stderr)
 
@@ -33,7 +51,7 @@ def make_locust_task(method_name):
         # Create and start the worker process
         process = mp.Process(
             target=run_servicex_test_worker,
-            args=(method_name, result_queue, error_queue)
+            args=(method_name, result_queue, error_queue, files)
         )
 
         try:
@@ -51,15 +69,17 @@ def make_locust_task(method_name):
 
                 print(f"⏰ ServiceX test {method_name} timed out after 300 seconds", file=sys.stderr)
                 self.logger.error(f"ServiceX test {method_name} timed out after 300 seconds")
-                raise Exception(f"ServiceX test {method_name} timed out")
+                raise ServiceXTimeoutError(method_name, "timed out after 300 seconds")
 
             # Check if process completed successfully
             if process.exitcode != 0:
                 # Try to get error information
                 try:
                     error_info = error_queue.get_nowait()
-                    print(f"❌ ServiceX test {method_name} failed: {error_info['error']}", file=sys.stderr)
-                    self.logger.error(f"ServiceX test {method_name} failed: {error_info['error']}")
+                    print(f"❌ ServiceX test {method_name} failed ({error_info.get('error_type', 'unknown')}): "
+                          f"{error_info['error']}", file=sys.stderr)
+                    self.logger.error(f"ServiceX test {method_name} failed ({error_info.get('error_type', 'unknown')}): "
+                                      f"{error_info['error']}")
                     self.logger.error(f"Traceback: {error_info['traceback']}")
 
                     # Log captured stdout/stderr to Locust logs
@@ -76,11 +96,11 @@ def make_locust_task(method_name):
                                 if line.strip():
                                     self.logger.error(f"[{method_name}] {line}")
 
-                    raise Exception(f"ServiceX test {method_name} failed: {error_info['error']}")
+                    raise error_from_info(method_name, error_info)
                 except Empty:
                     print(f"❌ ServiceX test {method_name} failed with exit code {process.exitcode}", file=sys.stderr)
                     self.logger.error(f"ServiceX test {method_name} failed with exit code {process.exitcode}")
-                    raise Exception(f"ServiceX test {method_name} failed with exit code {process.exitcode}")
+                    raise ServiceXTestError(method_name, f"exit code {process.exitcode}")
 
             # Get the successful result
             try:
@@ -107,11 +127,11 @@ def make_locust_task(method_name):
                     return result_info  # Return the info dict, not a non-existent 'result' key
                 else:
                     print(f"❌ ServiceX test {method_name} unexpected error in result", file=sys.stderr)
-                    raise Exception(f"Unexpected error in result: {result_info}")
+                    raise ServiceXTestError(method_name, f"unexpected error in result: {result_info}")
             except Empty:
                 print(f"⚠️ ServiceX test {method_name} completed but no result available", file=sys.stderr)
                 self.logger.error(f"ServiceX test {method_name} completed but no result available")
-                raise Exception(f"ServiceX test {method_name} completed but no result available")
+                raise ServiceXTestError(method_name, "completed but no result available")
 
         except Exception as e:
             # Ensure process is cleaned up
@@ -137,6 +157,33 @@ def make_locust_task(method_name):
             except Empty:
                 pass
 
+    def locust_task(self, files=None):
+        max_retries = self.servicex_config.max_retries
+
+        for attempt in range(max_retries + 1):
+            # Retries are reported under their own request type so their count and
+            # timing can be told apart from first attempts in the Locust statistics
+            request_type = "servicex" if attempt == 0 else "servicex_retry"
+            start_time = time.perf_counter()
+            try:
+                result_info = run_servicex_test(self, files)
+            except Exception as e:
+                _fire_request_event(self, request_type, method_name, start_time, e, attempt)
+
+                if not should_retry(e, attempt, max_retries):
+                    raise
+
+                delay = retry_delay(attempt, self.servicex_config.retry_backoff,
+                                    self.servicex_config.retry_backoff_max)
+                print(f"🔁 Retrying ServiceX test {method_name} in {delay:.1f}s "
+                      f"(attempt {attempt + 2}/{max_retries + 1})", file=sys.stderr)
+                self.logger.warning(f"Retrying ServiceX test {method_name} after {e.category} error "
+                                    f"in {delay:.1f}s (attempt {attempt + 2}/{max_retries + 1})")
+                time.sleep(delay)
+            else:
+                _fire_request_event(self, request_type, method_name, start_time, attempt=attempt)
+                return result_info
+
     # Set the required Locust task attributes
     # locust_task._is_locust_task_method = True
     # locust_task.locust_task_weight = 1
@@ -9,8 +9,11 @@ def locust_task(func):
     func.__is_servicex_locust_test__ = True
     return func
 
-def run_servicex_test_worker(method_name, result_queue, error_queue):
-    """Worker function to run ServiceX tests in a separate process."""
+def run_servicex_test_worker(method_name, result_queue, error_queue, files=None):
+    """Worker function to run ServiceX tests in a separate process.
+
+    If files is given, it replaces the dataset of every sample in the test's spec.
+    """
     import os
     import sys
     import io
@@ -65,10 +68,18 @@ def run_servicex_test_worker(method_name, result_queue, error_queue):
         # Execute the test method to get the spec
         spec = test_method()
 
+        if files:
+            from servicex import dataset
+            for sample in spec["Sample"]:
+                sample["Dataset"] = dataset.FileList(files)
+
         # Import and run ServiceX deliver - this uses asyncio
         from servicex import deliver
+        # By default deliver() returns failed samples as invalid GuardLists instead of
+        # raising; let the original exception propagate so it gets classified
         result = deliver(
             spec,
+            return_exceptions=False,
             # ignore_local_cache=True,
             # progress_bar='none'
         )
@@ -91,10 +102,15 @@ def run_servicex_test_worker(method_name, result_queue, error_queue):
         stdout_content = stdout_capture.getvalue()
         stderr_content = stderr_capture.getvalue()
 
+        # Classify here, where the original exception type is still available
+        from sx_locust.errors import classify_exception
+
         # Put error information in error queue
         error_queue.put({
             'success': False,
             'error': str(e),
+            'error_type': classify_exception(e),
+            'exception_class': type(e).__name__,
             'traceback': traceback.format_exc(),
             'stdout': stdout_content,
             'stderr': stderr_content
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from sx_locust.errors import (
+    ServiceXAppError,
+    ServiceXClientError,
+    ServiceXTestError,
+    ServiceXTimeoutError,
+    TransformFailedError,
+    WorkerImportError,
+    classify_exception,
+    error_from_info,
+    retry_delay,
+    should_retry,
+)
+
+
+class ServiceXException(Exception):
+    """Stand-in for servicex.query_core.ServiceXException."""
+
+
+class AuthorizationError(Exception):
+    """Stand-in for servicex.servicex_adapter.AuthorizationError."""
+
+
+class ReadTimeout(Exception):
+    """Stand-in for httpx.ReadTimeout."""
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class HTTPStatusError(Exception):
+    """Stand-in for httpx.HTTPStatusError, which carries the response."""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.response = FakeResponse(status_code)
+
+
+@pytest.mark.parametrize("exc, category", [
+    (ModuleNotFoundError("No module named 'func_adl_servicex_xaodr22'"), "import"),
+    (asyncio.TimeoutError(), "timeout"),
+    (TimeoutError("timed out"), "timeout"),
+    (ReadTimeout("The read operation timed out"), "timeout"),
+    (RuntimeError("ServiceX WebAPI Error during transformation submission: "
+                  "500 - Something went wrong"), "servicex_app"),
+    (RuntimeError("ServiceX WebAPI Error during transformation: "
+                  "503 - Service Unavailable"), "servicex_app"),
+    (RuntimeError("ServiceX WebAPI Error during transformation submission: "
+                  "400 - Malformed request"), "servicex_client"),
+    (HTTPStatusError("Server error '502 Bad Gateway'", 502), "servicex_app"),
+    (HTTPStatusError("Client error '404 Not Found'", 404), "servicex_client"),
+    (AuthorizationError("Not authorized to access serviceX at http://servicex"), "servicex_client"),
+    (ServiceXException('Transform "func_adl_xAOD_simple" completed with failures: '
+                       '1/3 files failed.  Will not cache.'), "transform"),
+    (ServiceXException('Transform "uproot" completed with failures: 3/3 files failed.  '
+                       'Will not cache.'), "transform"),
+    (RuntimeError("ReadError while polling transform status: connection error"), "unknown"),
+    (ServiceXException('Transform "uproot" failed with an error'), "unknown"),
+    (ValueError("Method uproot_raw_query is not a valid ServiceX test"), "unknown"),
+    (RuntimeError("Dataset does not exist"), "unknown"),
+])
+def test_classify_exception(exc, category):
+    assert classify_exception(exc) == category
+
+
+def test_classify_exception_follows_cause():
+    try:
+        try:
+            raise asyncio.TimeoutError()
+        except asyncio.TimeoutError as e:
+            raise RuntimeError("Exception occurred while making ServiceX request.") from e
+    except RuntimeError as e:
+        assert classify_exception(e) == "timeout"
+
+
+@pytest.mark.parametrize("error_type, error_class", [
+    ("timeout", ServiceXTimeoutError),
+    ("servicex_app", ServiceXAppError),
+    ("servicex_client", ServiceXClientError),
+    ("transform", TransformFailedError),
+    ("import", WorkerImportError),
+    ("unknown", ServiceXTestError),
+    ("something_new", ServiceXTestError),
+])
+def test_error_from_info(error_type, error_class):
+    error = error_from_info("uproot_raw_query", {
+        "error": "boom",
+        "error_type": error_type,
+        "exception_class": "RuntimeError",
+    })
+    assert type(error) is error_class
+    assert str(error) == "ServiceX test uproot_raw_query failed: boom"
+    assert error.exception_class == "RuntimeError"
+
+
+def test_repr_ignores_message():
+    first = error_from_info("m", {"error": "500 - request 1 failed", "error_type": "servicex_app"})
+    second = error_from_info("m", {"error": "500 - request 2 failed", "error_type": "servicex_app"})
+    assert repr(first) == repr(second) == "ServiceXAppError('servicex_app')"
+
+
+@pytest.mark.parametrize("exc, attempt, max_retries, expected", [
+    (ServiceXTimeoutError("m", "timed out"), 0, 3, True),
+    (ServiceXAppError("m", "500"), 2, 3, True),
+    (ServiceXAppError("m", "500"), 3, 3, False),
+    (ServiceXAppError("m", "500"), 0, 0, False),
+    (ServiceXClientError("m", "400"), 0, 3, False),
+    (TransformFailedError("m", "1/3 files failed"), 0, 3, False),
+    (WorkerImportError("m", "No module"), 0, 3, False),
+    (ServiceXTestError("m", "exit code 1"), 0, 3, False),
+    (RuntimeError("not a test error"), 0, 3, False),
+])
+def test_should_retry(exc, attempt, max_retries, expected):
+    assert should_retry(exc, attempt, max_retries) is expected
+
+
+def test_retry_delay_is_exponential_and_capped():
+    assert [retry_delay(attempt, 1.0, 5.0) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
@@ -0,0 +1,161 @@
+import gzip
+import json
+
+import pytest
+
+from sx_locust.replay import (
+    TraceReplay,
+    get_trace_replay,
+    parse_trace_line,
+    read_trace,
+    read_trace_start,
+    start_trace_replay,
+    stop_trace_replay,
+)
+
+
+def write_trace(path, records):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "wt") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def trace_records():
+    return [{"timestamp": 1000 + i * 10, "task": "uproot_raw_query"} for i in range(10)]
+
+
+@pytest.mark.parametrize("timestamp, expected", [
+    (1718000000.5, 1718000000.5),
+    (1718000000, 1718000000.0),
+    ("2024-06-10T06:13:20Z", 1718000000.0),
+    ("2024-06-10T06:13:20+00:00", 1718000000.0),
+    ("2024-06-10T08:13:20+02:00", 1718000000.0),
+    ("2024-06-10T06:13:20", 1718000000.0),
+    ("2024-06-10T06:13:20.250Z", 1718000000.25),
+])
+def test_parse_trace_line_timestamps(timestamp, expected):
+    record = parse_trace_line(json.dumps({"timestamp": timestamp, "task": "uproot_raw_query"}), 4)
+    assert record.timestamp == expected
+    assert record.task == "uproot_raw_query"
+    assert record.line_number == 4
+    assert record.files is None
+
+
+def test_parse_trace_line_files():
+    line = json.dumps({"timestamp": 1, "task": "func_adl_xaod_simple", "files": ["root://a", "root://b"]})
+    assert parse_trace_line(line, 0).files == ["root://a", "root://b"]
+
+
+@pytest.mark.parametrize("line", [
+    "not json",
+    json.dumps({"task": "uproot_raw_query"}),
+    json.dumps({"timestamp": 1}),
+    json.dumps({"timestamp": "yesterday", "task": "uproot_raw_query"}),
+    json.dumps({"timestamp": None, "task": "uproot_raw_query"}),
+    json.dumps([1, "uproot_raw_query"]),
+])
+def test_parse_trace_line_rejects_bad_lines(line):
+    with pytest.raises(ValueError, match="line 8"):
+        parse_trace_line(line, 7)
+
+
+@pytest.mark.parametrize("shard_count", [1, 2, 3, 4, 7, 12])
+def test_read_trace_shards_cover_every_line_once(tmp_path, trace_records, shard_count):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    line_numbers = [
+        record.line_number
+        for shard_index in range(shard_count)
+        for record in read_trace(path, shard_index, shard_count)
+    ]
+    assert sorted(line_numbers) == list(range(len(trace_records)))
+
+
+def test_read_trace_gzip(tmp_path, trace_records):
+    path = write_trace(tmp_path / "trace.jsonl.gz", trace_records)
+    assert [record.timestamp for record in read_trace(path)] == [r["timestamp"] for r in trace_records]
+    assert read_trace_start(path) == 1000
+
+
+def test_read_trace_skips_blank_lines(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text('\n{"timestamp": 5, "task": "a"}\n\n{"timestamp": 6, "task": "b"}\n')
+    assert [record.task for record in read_trace(str(path))] == ["a", "b"]
+    assert read_trace_start(str(path)) == 5
+
+
+def test_read_trace_start_empty_trace(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text("\n")
+    with pytest.raises(ValueError, match="empty"):
+        read_trace_start(str(path))
+
+
+@pytest.mark.parametrize("speedup", [1.0, 2.0, 10.0])
+def test_due_time_uses_speedup_and_shared_start(tmp_path, trace_records, speedup):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    # A shard that doesn't contain the first line still measures from the trace's start
+    replay = TraceReplay(path, started_at=5000.0, speedup=speedup, shard_index=1, shard_count=2)
+    record = replay.next_record()
+    assert record.line_number == 1
+    assert replay.due_time(record) == 5000.0 + 10 / speedup
+
+
+def test_wait_for_reports_lag_without_sleeping(tmp_path, trace_records, monkeypatch):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    replay = TraceReplay(path, started_at=5000.0)
+    monkeypatch.setattr("sx_locust.replay.time.time", lambda: 5012.5)
+    monkeypatch.setattr("sx_locust.replay.time.sleep", lambda seconds: pytest.fail("slept"))
+    replay.next_record()
+    assert replay.wait_for(replay.next_record()) == pytest.approx(2.5)
+
+
+def test_wait_for_sleeps_until_due(tmp_path, trace_records, monkeypatch):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    replay = TraceReplay(path, started_at=5000.0, speedup=2.0)
+    sleeps = []
+    monkeypatch.setattr("sx_locust.replay.time.time", lambda: 5001.0)
+    monkeypatch.setattr("sx_locust.replay.time.sleep", sleeps.append)
+    replay.next_record()
+    assert replay.wait_for(replay.next_record()) == 0.0
+    assert sleeps == [4.0]
+
+
+def test_start_trace_replay_replaces_previous_replay(tmp_path, trace_records):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    first = start_trace_replay(path, started_at=1.0)
+    while first.next_record() is not None:
+        pass
+
+    second = start_trace_replay(path, started_at=2.0)
+    assert get_trace_replay() is second
+    assert second.next_record().line_number == 0
+
+    stop_trace_replay()
+    assert get_trace_replay() is None
+
+
+def test_read_trace_skips_malformed_lines(tmp_path, caplog):
+    path = tmp_path / "trace.jsonl"
+    path.write_text('{"timestamp": 5, "task": "a"}\nGARBAGE\n{"timestamp": 7, "task": "c"}\n')
+    replay = TraceReplay(str(path), started_at=0.0)
+    assert [replay.next_record().task, replay.next_record().task] == ["a", "c"]
+    assert replay.next_record() is None
+    assert "line 2" in caplog.text
+
+
+def test_read_trace_start_rejects_malformed_first_line(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text('GARBAGE\n{"timestamp": 7, "task": "c"}\n')
+    with pytest.raises(ValueError, match="line 1"):
+        read_trace_start(str(path))
+
+
+def test_start_trace_replay_failure_clears_previous_replay(tmp_path, trace_records):
+    path = write_trace(tmp_path / "trace.jsonl", trace_records)
+    start_trace_replay(path, started_at=1.0)
+    with pytest.raises(OSError):
+        start_trace_replay(str(tmp_path / "missing.jsonl"), started_at=2.0)
+    assert get_trace_replay() is None
@@ -0,0 +1,137 @@
+import logging
+import queue
+from types import SimpleNamespace
+
+import pytest
+
+from sx_locust import util
+from sx_locust.config import ServiceXConfig
+from sx_locust.errors import ServiceXAppError, TransformFailedError
+
+
+class FakeProcess:
+    """Stands in for mp.Process, reporting the next scripted outcome on its queues."""
+
+    outcomes = []
+
+    def __init__(self, target, args):
+        self.method_name, self.result_queue, self.error_queue, self.files = args
+        self.exitcode = None
+
+    def start(self):
+        outcome = self.outcomes.pop(0)
+        if outcome == "success":
+            self.result_queue.put({"success": True, "spec_keys": ["Sample"]})
+            self.exitcode = 0
+        else:
+            self.error_queue.put({
+                "success": False,
+                "error": f"{outcome} failure",
+                "error_type": outcome,
+                "exception_class": "RuntimeError",
+                "traceback": "",
+            })
+            self.exitcode = 1
+
+    def join(self, timeout=None):
+        pass
+
+    def is_alive(self):
+        return False
+
+
+class FakeClock:
+    """Stands in for the time module: each perf_counter() call advances by one second."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        self.now += 1.0
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(util, "time", clock)
+    monkeypatch.setattr(util, "mp", SimpleNamespace(Process=FakeProcess, Queue=queue.Queue))
+    return clock
+
+
+def make_user(max_retries):
+    events = []
+    request = SimpleNamespace(fire=lambda **kwargs: events.append(kwargs))
+    user = SimpleNamespace(
+        servicex_config=ServiceXConfig(
+            endpoint="http://servicex", max_retries=max_retries, retry_backoff=1.0, retry_backoff_max=3.0
+        ),
+        environment=SimpleNamespace(events=SimpleNamespace(request=request)),
+        logger=logging.getLogger("test"),
+    )
+    return user, events
+
+
+def run_task(user, outcomes):
+    FakeProcess.outcomes = list(outcomes)
+    return util.make_locust_task("uproot_raw_query")(user)
+
+
+def test_success_fires_single_event(clock):
+    user, events = make_user(max_retries=3)
+    result = run_task(user, ["success"])
+
+    assert result["success"] is True
+    assert [(e["request_type"], e["exception"]) for e in events] == [("servicex", None)]
+    assert events[0]["name"] == "uproot_raw_query"
+    assert events[0]["response_time"] == 1000.0
+    assert clock.sleeps == []
+
+
+def test_retries_reported_separately_with_backoff(clock):
+    user, events = make_user(max_retries=3)
+    result = run_task(user, ["servicex_app", "timeout", "servicex_app", "success"])
+
+    assert result["success"] is True
+    assert [e["request_type"] for e in events] == ["servicex", "servicex_retry", "servicex_retry", "servicex_retry"]
+    assert [repr(e["exception"]) for e in events] == [
+        "ServiceXAppError('servicex_app')",
+        "ServiceXTimeoutError('timeout')",
+        "ServiceXAppError('servicex_app')",
+        "None",
+    ]
+    assert [e["context"]["attempt"] for e in events] == [0, 1, 2, 3]
+    # Every attempt is timed on its own, not including the backoff before it
+    assert [e["response_time"] for e in events] == [1000.0] * 4
+    assert clock.sleeps == [1.0, 2.0, 3.0]
+
+
+def test_final_failure_raised_after_max_retries(clock):
+    user, events = make_user(max_retries=2)
+    with pytest.raises(ServiceXAppError):
+        run_task(user, ["servicex_app", "servicex_app", "servicex_app", "success"])
+
+    assert [e["request_type"] for e in events] == ["servicex", "servicex_retry", "servicex_retry"]
+    assert all(isinstance(e["exception"], ServiceXAppError) for e in events)
+    assert clock.sleeps == [1.0, 2.0]
+
+
+def test_non_retryable_failure_raised_immediately(clock):
+    user, events = make_user(max_retries=3)
+    with pytest.raises(TransformFailedError):
+        run_task(user, ["transform", "success"])
+
+    assert [e["request_type"] for e in events] == ["servicex"]
+    assert clock.sleeps == []
+
+
+def test_retries_off_by_default(clock):
+    user, events = make_user(max_retries=ServiceXConfig(endpoint="http://servicex").max_retries)
+    with pytest.raises(ServiceXAppError):
+        run_task(user, ["servicex_app", "success"])
+
+    assert [e["request_type"] for e in events] == ["servicex"]